@@ -5,240 +5,292 @@ from botocore.exceptions import ClientError
 # Initialize DynamoDB client
 dynamodb = boto3.resource('dynamodb')
 
+# Headers shared by every response; copied per response so callers can't mutate them
+RESPONSE_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
+# Static response bodies are serialized once at cold start
+ADDED_BODY = json.dumps({'message': 'Item added successfully'})
+UPDATED_BODY = json.dumps({'message': 'Item updated successfully'})
+DELETED_BODY = json.dumps({'message': 'Item deleted successfully'})
+UNEXPECTED_ERROR_BODY = json.dumps({'error': 'An unexpected error occurred'})
+
+# Maximum number of operations accepted in a single "actions" envelope
+MAX_BATCH_ACTIONS = 25
+
+# Field fragments reused by the action schemas below
+_STRING = (str,)
+_BOOL = (bool,)
+_TODO_FIELDS = {
+    'id': _STRING,
+    'description': _STRING,
+    'due_time': _STRING,
+    'due_date': _STRING,
+    'completed': _BOOL,
+    'created_at': _STRING
+}
+
+
+def _compile_schema(required, fields):
+    """Freeze a schema into the (required, field types) pair used by validate_params"""
+    return (tuple(required), tuple(fields.items()))
+
+
+# Per-action schemas, compiled once at cold start
+SCHEMAS = {
+    'getTodoItems': _compile_schema((), {}),
+    'addTodoItem': _compile_schema(('id',), _TODO_FIELDS),
+    'updateTodoItem': _compile_schema(('id',), {'id': _STRING, 'completed': _BOOL}),
+    'deleteTodoItem': _compile_schema(('id',), {'id': _STRING})
+}
+
+
+def build_response(status_code, body):
+    """Build a Lambda proxy response from an already serialized JSON body"""
+    return {
+        'statusCode': status_code,
+        'headers': dict(RESPONSE_HEADERS),
+        'body': body
+    }
+
+
+def error_response(status_code, message):
+    """Build an error response with a JSON {'error': message} body"""
+    return build_response(status_code, json.dumps({'error': message}))
+
+
+def parse_body(event):
+    """
+    Return the event's HTTP 'body' as a dict, or None if it is missing or
+    isn't a JSON object. The body is parsed exactly once here.
+    """
+    body = event.get('body')
+
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError as e:
+            print(f"Error parsing body: {str(e)}")
+            body = None
+
+    return body if isinstance(body, dict) else None
+
+
+def item_params(action, event, body):
+    """
+    Collect the schema fields for action.
+    A parsed body is used exclusively; without one the fields come from the
+    top-level event. Control keys (action, actions, table_name) are never
+    read from here, so the body can't change what runs or on which table.
+    """
+    source = body if body is not None else event
+    _, fields = SCHEMAS[action]
+    return {name: source[name] for name, _ in fields if name in source}
+
+
+def validate_params(action, params):
+    """Return an error message if params don't match the action's schema, else None"""
+    required, fields = SCHEMAS[action]
+
+    for name in required:
+        if params.get(name) in (None, ''):
+            return f"Missing required field '{name}' for {action}"
+
+    for name, types in fields:
+        value = params.get(name)
+        if value is not None and not isinstance(value, types):
+            return f"Invalid type for field '{name}' in {action}"
+
+    return None
+
+
 def lambda_handler(event, context):
     """
     Main handler function for AWS Lambda.
-    This function routes to the appropriate handler based on the action parameter.
+    A single invocation either runs one action, or several when the event
+    carries an 'actions' list, e.g.
+    {"table_name": "TodoTable", "actions": [{"action": "addTodoItem", ...}, ...]}
     """
+    body = parse_body(event)
+
+    # Get table name from event or use default
+    table_name = event.get('table_name', 'TodoTable')
+
+    if 'actions' in event:
+        return dispatch_batch(event['actions'], table_name)
+
+    # Batches are only accepted from the invocation payload, not an HTTP body
+    if body is not None and 'actions' in body:
+        return error_response(400, "'actions' must be sent at the top level of the event, not in the body")
+
     # Get action from event or fall back to function name
     action = event.get('action')
-    
+
     # For backward compatibility, if no action is specified, try to use function name
     if not action and context:
         action = context.function_name
-    
+
     # Default to getTodoItems if no action can be determined
     if not action:
         action = "getTodoItems"
-    
-    # Get table name from event or use default
-    table_name = event.get('table_name', 'TodoTable')
-    
-    # Route to the appropriate handler based on action
-    if action == "getTodoItems":
-        return get_todo_items(table_name)
-    elif action == "addTodoItem":
-        return add_todo_item(event, table_name)
-    elif action == "updateTodoItem":
-        return update_todo_item(event, table_name)
-    elif action == "deleteTodoItem":
-        return delete_todo_item(event, table_name)
-    else:
-        return {
-            'statusCode': 400,
-            'body': json.dumps({'error': f'Unknown action: {action}'})
-        }
 
-def get_todo_items(table_name):
+    return dispatch(action, event, body, table_name)
+
+
+def dispatch(action, event, body, table_name):
+    """Validate the item fields and run the registered handler for action"""
+    handler = ACTIONS.get(action) if isinstance(action, str) else None
+    if handler is None:
+        return error_response(400, f'Unknown action: {action}')
+
+    params = item_params(action, event, body)
+    error = validate_params(action, params)
+    if error:
+        return error_response(400, error)
+
+    return handler(params, table_name)
+
+
+def dispatch_batch(actions, table_name):
+    """
+    Run each entry of an 'actions' envelope in order against table_name.
+    Entries can't pick their own table. The response body is a JSON list with
+    one {"action", "statusCode", "body"} result per entry; a failing entry
+    doesn't stop the ones after it.
+    """
+    if not isinstance(actions, list) or not actions:
+        return error_response(400, "'actions' must be a non-empty list")
+
+    if len(actions) > MAX_BATCH_ACTIONS:
+        return error_response(400, f"At most {MAX_BATCH_ACTIONS} actions are allowed per request")
+
+    results = []
+    for entry in actions:
+        if isinstance(entry, dict) and entry.get('action'):
+            action = entry['action']
+            response = dispatch(action, entry, parse_body(entry), table_name)
+        else:
+            action = None
+            response = error_response(400, "Each entry in 'actions' needs an 'action'")
+
+        # Sub-response bodies are already JSON, so splice them in rather than re-serializing
+        results.append(
+            '{"action": %s, "statusCode": %d, "body": %s}'
+            % (json.dumps(action), response['statusCode'], response['body'])
+        )
+
+    return build_response(200, '[' + ', '.join(results) + ']')
+
+
+def get_todo_items(params, table_name):
     """Get all todo items from DynamoDB table"""
     table = dynamodb.Table(table_name)
-    
+
     try:
         # Scan the table to get all items
         response = table.scan()
         items = response.get('Items', [])
-        
+
         # Continue scanning if we have more items (pagination)
         while 'LastEvaluatedKey' in response:
             response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
             items.extend(response.get('Items', []))
-        
+
         # Return success response with items
         # Important: ensure proper JSON encoding with no trailing information
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps(items, ensure_ascii=False)
-        }
-    
+        return build_response(200, json.dumps(items, ensure_ascii=False))
+
     except ClientError as e:
         # Return error response
         print(f"Error getting items from DynamoDB: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': str(e)
-            })
-        }
-    
+        return error_response(500, str(e))
+
     except Exception as e:
         # Return error response for other exceptions
         print(f"Unexpected error: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'An unexpected error occurred'
-            })
-        }
+        return build_response(500, UNEXPECTED_ERROR_BODY)
+
 
-def add_todo_item(event, table_name):
+def add_todo_item(params, table_name):
     """Add a new todo item to DynamoDB table"""
     table = dynamodb.Table(table_name)
-    
+
     try:
-        # Parse item data from event
-        # Check if we have a 'body' parameter (from HTTP API)
-        if 'body' in event:
-            try:
-                # If body is a string, parse it as JSON
-                if isinstance(event['body'], str):
-                    body_data = json.loads(event['body'])
-                else:
-                    body_data = event['body']
-                    
-                # Use the parsed body data
-                item = {
-                    'id': body_data.get('id'),
-                    'description': body_data.get('description', ''),
-                    'due_time': body_data.get('due_time', ''),
-                    'due_date': body_data.get('due_date', ''),
-                    'completed': body_data.get('completed', False),
-                    'created_at': body_data.get('created_at', '')
-                }
-            except Exception as e:
-                print(f"Error parsing body: {str(e)}")
-                # Fallback to direct event parameters
-                item = {
-                    'id': event.get('id'),
-                    'description': event.get('description', ''),
-                    'due_time': event.get('due_time', ''),
-                    'due_date': event.get('due_date', ''),
-                    'completed': event.get('completed', False),
-                    'created_at': event.get('created_at', '')
-                }
-        else:
-            # Direct parameters (no body)
-            item = {
-                'id': event.get('id'),
-                'description': event.get('description', ''),
-                'due_time': event.get('due_time', ''),
-                'due_date': event.get('due_date', ''),
-                'completed': event.get('completed', False),
-                'created_at': event.get('created_at', '')
-            }
-        
+        item = {
+            'id': params.get('id'),
+            'description': params.get('description', ''),
+            'due_time': params.get('due_time', ''),
+            'due_date': params.get('due_date', ''),
+            'completed': params.get('completed', False),
+            'created_at': params.get('created_at', '')
+        }
+
         # Put item in DynamoDB
-        response = table.put_item(Item=item)
-        
+        table.put_item(Item=item)
+
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'message': 'Item added successfully'})
-        }
-    
+        return build_response(200, ADDED_BODY)
+
     except Exception as e:
         # Return error response
         print(f"Error adding item to DynamoDB: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': str(e)
-            })
-        }
+        return error_response(500, str(e))
 
-def update_todo_item(event, table_name):
+
+def update_todo_item(params, table_name):
     """Update a todo item in DynamoDB table"""
     table = dynamodb.Table(table_name)
-    
+
     try:
-        # Get item ID and completed status from event
-        item_id = event.get('id')
-        completed = event.get('completed', False)
-        
+        # Get item ID and completed status from params
+        item_id = params.get('id')
+        completed = params.get('completed', False)
+
         # Update item in DynamoDB
-        response = table.update_item(
+        table.update_item(
             Key={'id': item_id},
             UpdateExpression="set completed = :c",
             ExpressionAttributeValues={':c': completed},
             ReturnValues="UPDATED_NEW"
         )
-        
+
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'message': 'Item updated successfully'})
-        }
-    
+        return build_response(200, UPDATED_BODY)
+
     except Exception as e:
         # Return error response
         print(f"Error updating item in DynamoDB: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': str(e)
-            })
-        }
+        return error_response(500, str(e))
+
 
-def delete_todo_item(event, table_name):
+def delete_todo_item(params, table_name):
     """Delete a todo item from DynamoDB table"""
     table = dynamodb.Table(table_name)
-    
+
     try:
-        # Get item ID from event
-        item_id = event.get('id')
-        
+        # Get item ID from params
+        item_id = params.get('id')
+
         # Delete item from DynamoDB
-        response = table.delete_item(
+        table.delete_item(
             Key={'id': item_id}
         )
-        
+
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'message': 'Item deleted successfully'})
-        }
-    
+        return build_response(200, DELETED_BODY)
+
     except Exception as e:
         # Return error response
         print(f"Error deleting item from DynamoDB: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': str(e)
-            })
-        } 
\ No newline at end of file
+        return error_response(500, str(e))
+
+
+# Registry of supported actions; every handler takes (params, table_name)
+ACTIONS = {
+    'getTodoItems': get_todo_items,
+    'addTodoItem': add_todo_item,
+    'updateTodoItem': update_todo_item,
+    'deleteTodoItem': delete_todo_item
+}
@@ -0,0 +1,158 @@
+import json
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+# boto3.resource is called at import time, so patch it before importing the module
+with mock.patch('boto3.resource'):
+    import lambda_function
+
+
+@pytest.fixture
+def table():
+    """Mocked DynamoDB table returned by dynamodb.Table()"""
+    table = mock.Mock()
+    table.scan.return_value = {'Items': [{'id': '1', 'description': 'Buy milk'}]}
+    with mock.patch.object(lambda_function, 'dynamodb') as dynamodb:
+        dynamodb.Table.return_value = table
+        yield table
+
+
+def body_of(response):
+    return json.loads(response['body'])
+
+
+def test_add_missing_id_returns_400(table):
+    response = lambda_function.lambda_handler({'action': 'addTodoItem', 'description': 'x'}, None)
+
+    assert response['statusCode'] == 400
+    assert 'id' in body_of(response)['error']
+    table.put_item.assert_not_called()
+
+
+def test_update_wrong_completed_type_returns_400(table):
+    event = {'action': 'updateTodoItem', 'id': '1', 'completed': 'yes'}
+    response = lambda_function.lambda_handler(event, None)
+
+    assert response['statusCode'] == 400
+    assert 'completed' in body_of(response)['error']
+    table.update_item.assert_not_called()
+
+
+def test_add_non_json_body_falls_back_to_event_fields(table):
+    event = {'action': 'addTodoItem', 'body': 'not json', 'id': '7', 'description': 'x'}
+    response = lambda_function.lambda_handler(event, None)
+
+    assert response['statusCode'] == 200
+    item = table.put_item.call_args.kwargs['Item']
+    assert item['id'] == '7'
+    assert item['description'] == 'x'
+
+
+@pytest.mark.parametrize('action', ['nope', ['x'], {'a': 1}])
+def test_unknown_action_returns_400(table, action):
+    response = lambda_function.lambda_handler({'action': action}, None)
+
+    assert response['statusCode'] == 400
+    assert 'Unknown action' in body_of(response)['error']
+
+
+def test_batch_failing_entry_does_not_stop_others(table):
+    event = {
+        'actions': [
+            {'action': 'addTodoItem', 'id': '1'},
+            {'action': 'deleteTodoItem'},
+            {'action': {'a': 1}},
+            {'action': 'getTodoItems'}
+        ]
+    }
+    response = lambda_function.lambda_handler(event, None)
+
+    assert response['statusCode'] == 200
+    results = body_of(response)
+    assert [r['statusCode'] for r in results] == [200, 400, 400, 200]
+    assert results[0]['body'] == {'message': 'Item added successfully'}
+    assert results[3]['body'] == [{'id': '1', 'description': 'Buy milk'}]
+    table.put_item.assert_called_once()
+    table.delete_item.assert_not_called()
+
+
+def test_batch_over_limit_is_rejected(table):
+    actions = [{'action': 'getTodoItems'}] * (lambda_function.MAX_BATCH_ACTIONS + 1)
+    response = lambda_function.lambda_handler({'actions': actions}, None)
+
+    assert response['statusCode'] == 400
+    table.scan.assert_not_called()
+
+
+def test_batch_in_http_body_is_rejected(table):
+    body = json.dumps({'actions': [{'action': 'updateTodoItem', 'id': '1', 'completed': True}]})
+    response = lambda_function.lambda_handler({'body': body}, None)
+
+    assert response['statusCode'] == 400
+    table.update_item.assert_not_called()
+    table.scan.assert_not_called()
+
+
+def test_batch_entries_use_envelope_table(table):
+    event = {'table_name': 'TodoTable', 'actions': [{'action': 'getTodoItems', 'table_name': 'Users'}]}
+    lambda_function.lambda_handler(event, None)
+
+    lambda_function.dynamodb.Table.assert_called_once_with('TodoTable')
+
+
+def test_body_cannot_set_action_or_table(table):
+    context = mock.Mock(function_name='getTodoItems')
+    body = json.dumps({'action': 'deleteTodoItem', 'id': '1', 'table_name': 'OtherTable'})
+    response = lambda_function.lambda_handler({'body': body}, context)
+
+    assert response['statusCode'] == 200
+    lambda_function.dynamodb.Table.assert_called_once_with('TodoTable')
+    table.scan.assert_called_once()
+    table.delete_item.assert_not_called()
+
+
+def test_update_reads_fields_only_from_body(table):
+    event = {'action': 'updateTodoItem', 'id': '1', 'completed': True, 'body': json.dumps({'id': '2'})}
+    lambda_function.lambda_handler(event, None)
+
+    kwargs = table.update_item.call_args.kwargs
+    assert kwargs['Key'] == {'id': '2'}
+    assert kwargs['ExpressionAttributeValues'] == {':c': False}
+
+
+def test_delete_without_body_reads_event_fields(table):
+    lambda_function.lambda_handler({'action': 'deleteTodoItem', 'id': '3'}, None)
+
+    table.delete_item.assert_called_once_with(Key={'id': '3'})
+
+
+def test_add_does_not_fill_missing_body_fields_from_event(table):
+    event = {'action': 'addTodoItem', 'description': 'from event', 'body': json.dumps({'id': '1'})}
+    lambda_function.lambda_handler(event, None)
+
+    item = table.put_item.call_args.kwargs['Item']
+    assert item['id'] == '1'
+    assert item['description'] == ''
+
+
+def test_batch_body_round_trips(table):
+    items = [{'id': '1', 'description': 'Café "quoted" \\ 日本'}]
+    table.scan.return_value = {'Items': items}
+    event = {
+        'actions': [
+            {'action': 'addTodoItem', 'body': json.dumps({'id': '1', 'description': 'Café "quoted"'})},
+            {'action': 'getTodoItems'},
+            'not a dict'
+        ]
+    }
+    response = lambda_function.lambda_handler(event, None)
+
+    results = json.loads(response['body'])
+    assert [r['action'] for r in results] == ['addTodoItem', 'getTodoItems', None]
+    assert results[1]['body'] == items
+    assert results[2]['statusCode'] == 400